@@ -19,7 +19,9 @@ from PIL import Image, ImageTk, ImageGrab
 import genanki
 import random
 import threading
-from typing import Optional, List, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Union, Iterable
 import io
 
 # Configure logging
@@ -33,6 +35,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def write_file_atomically(filepath: Union[str, Path], chunks: Iterable[bytes]):
+    """Write chunks to filepath via a .part file so a failed write never leaves a truncated file"""
+    part_path = f"{filepath}.part"
+    completed = False
+    try:
+        with open(part_path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        
+        # Only complete files ever appear under the final name
+        os.replace(part_path, filepath)
+        completed = True
+        
+    finally:
+        if not completed:
+            Path(part_path).unlink(missing_ok=True)
+
 class PexelsImageFetcher:
     """Module for fetching images from Pexels API"""
     
@@ -40,9 +59,33 @@ class PexelsImageFetcher:
         self.api_key = api_key
         self.base_url = "https://api.pexels.com/v1/search"
         self.headers = {"Authorization": api_key}
+        self._local = threading.local()  # One pooled requests.Session per long-lived worker thread
+        self._sessions: List[requests.Session] = []  # Every thread's session, so close() can reach them
+        self._sessions_lock = threading.Lock()
+        self._search_cache: Dict[tuple, List[Dict]] = {}
+    
+    def _session(self) -> requests.Session:
+        """Get this thread's HTTP session (requests.Session isn't guaranteed thread-safe)"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def close(self):
+        """Close all HTTP sessions and their pooled connections"""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
         
     def search_images(self, query: str, per_page: int = 5) -> List[Dict]:
-        """Search for images using Pexels API"""
+        """Search for images using Pexels API (results are cached per query)"""
+        cache_key = (query, per_page)
+        if cache_key in self._search_cache:
+            return self._search_cache[cache_key]
+        
         try:
             params = {
                 "query": query,
@@ -50,7 +93,7 @@ class PexelsImageFetcher:
                 "size": "medium"
             }
             
-            response = requests.get(
+            response = self._session().get(
                 self.base_url, 
                 headers=self.headers, 
                 params=params,
@@ -59,7 +102,9 @@ class PexelsImageFetcher:
             response.raise_for_status()
             
             data = response.json()
-            return data.get("photos", [])
+            photos = data.get("photos", [])
+            self._search_cache[cache_key] = photos
+            return photos
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching images for '{query}': {e}")
@@ -68,18 +113,29 @@ class PexelsImageFetcher:
     def download_image(self, url: str, filepath: str) -> bool:
         """Download image from URL to local filepath"""
         try:
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()
-            
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            with self._session().get(url, timeout=15, stream=True) as response:
+                response.raise_for_status()
+                
+                # Stream to disk in chunks instead of holding the whole body in memory
+                write_file_atomically(filepath, response.iter_content(chunk_size=64 * 1024))
             
             logger.info(f"Downloaded image: {filepath}")
             return True
             
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, OSError) as e:
             logger.error(f"Error downloading image from {url}: {e}")
             return False
+    
+    def fetch_image_bytes(self, url: str) -> Optional[bytes]:
+        """Fetch an image into memory, or None on failure"""
+        try:
+            response = self._session().get(url, timeout=10)
+            response.raise_for_status()
+            return response.content
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching image from {url}: {e}")
+            return None
 
 class StateManager:
     """Manages pipeline state and CSV operations"""
@@ -105,7 +161,11 @@ class StateManager:
                         self.df[col] = False
                     else:
                         raise ValueError(f"Required column '{col}' not found in CSV")
-            
+
+            # Normalize state columns once so later lookups don't have to handle NaN/mixed types
+            self.df['image_path'] = self.df['image_path'].fillna('').astype(str)
+            self.df['approved'] = self.df['approved'] == True
+
             logger.info(f"Loaded CSV with {len(self.df)} rows")
             
         except Exception as e:
@@ -114,11 +174,15 @@ class StateManager:
     
     def save_csv(self):
         """Save current state to CSV"""
+        # Write to a temp file and swap it in so a crash mid-write can't truncate progress
+        tmp_path = f"{self.csv_path}.tmp"
         try:
-            self.df.to_csv(self.csv_path, index=False)
+            self.df.to_csv(tmp_path, index=False)
+            os.replace(tmp_path, self.csv_path)
             logger.info("CSV saved successfully")
         except Exception as e:
             logger.error(f"Error saving CSV: {e}")
+            Path(tmp_path).unlink(missing_ok=True)
     
     def get_current_word(self) -> Optional[Dict]:
         """Get current word data"""
@@ -142,7 +206,7 @@ class StateManager:
         """Get current progress statistics"""
         total = len(self.df)
         processed = self.current_index
-        approved = len(self.df[self.df['approved'] == True])
+        approved = int(self.df['approved'].sum())  # bool column, see load_csv
         
         return {
             'total': total,
@@ -154,12 +218,21 @@ class StateManager:
 class ImageApprovalGUI:
     """GUI for image approval workflow"""
     
+    PREVIEW_CACHE_SIZE = 32  # Decoded preview thumbnails kept for back/forward navigation
+    NETWORK_WORKERS = 3  # Long-lived threads for searches and preview loads, so their sessions stay warm
+    
     def __init__(self, master, state_manager: StateManager, image_fetcher: PexelsImageFetcher):
         self.master = master
         self.state_manager = state_manager
         self.image_fetcher = image_fetcher
         self.current_images = []
         self.current_image_index = 0
+        self.display_generation = 0  # Bumped per preview request so stale loads are dropped
+        self.pending_display_job = None  # after() id of a debounced preview load
+        self.preview_cache = OrderedDict()  # image URL -> (raw bytes, thumbnail), least recently used first
+        self.prefetching = {}  # image URL -> generation waiting on its in-flight prefetch (None if unrequested)
+        self.exporting = False  # True while a deck export is running
+        self.network_pool = ThreadPoolExecutor(max_workers=self.NETWORK_WORKERS)
         self.media_dir = Path("media")
         self.media_dir.mkdir(exist_ok=True)
         
@@ -171,6 +244,7 @@ class ImageApprovalGUI:
         self.master.title("Chinese Vocabulary Image Approval")
         self.master.geometry("800x700")
         self.master.configure(bg='#f0f0f0')
+        self.master.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Main frame
         main_frame = ttk.Frame(self.master, padding="20")
@@ -315,9 +389,15 @@ class ImageApprovalGUI:
         word = self.state_manager.get_current_word()
         if not word:
             messagebox.showinfo("Complete", "All words have been processed!")
-            self.export_btn.config(state=tk.NORMAL)
+            self.enable_export()
             return
         
+        # Nothing still loading for the previous word's images may show up under this one
+        self.cancel_pending_display()
+        self.display_generation += 1
+        self.image_label.config(text="Loading images...", image="")
+        self.use_image_btn.config(state=tk.DISABLED)
+        
         self.chinese_label.config(text=word['simplified'])
         self.pinyin_label.config(text=word['pinyin'])
         self.english_label.config(text=word['english_meaning'])
@@ -325,21 +405,29 @@ class ImageApprovalGUI:
         self.update_progress()
         self.status_label.config(text="Fetching images...", foreground="orange")
         
-        # Fetch images in separate thread
-        threading.Thread(
-            target=self.fetch_images, 
-            args=(word['english_meaning'],),
-            daemon=True
-        ).start()
-        
-    def fetch_images(self, query: str):
+        # Fetch images on a network worker thread
+        self.network_pool.submit(
+            self.fetch_images,
+            word['english_meaning'],
+            self.state_manager.current_index
+        )
+    
+    def fetch_images(self, query: str, word_index: int):
         """Fetch images for current word"""
-        self.current_images = self.image_fetcher.search_images(query)
-        self.current_image_index = 0
+        images = self.image_fetcher.search_images(query)
         
         # Update UI in main thread
-        self.master.after(0, self.update_image_display)
+        self.master.after(0, self.show_search_results, images, word_index)
+    
+    def show_search_results(self, images: List[Dict], word_index: int):
+        """Show search results if they are still for the current word"""
+        if word_index != self.state_manager.current_index:
+            return  # User has moved on since this search started
         
+        self.current_images = images
+        self.current_image_index = 0
+        self.update_image_display()
+    
     def update_image_display(self):
         """Update image display"""
         if not self.current_images:
@@ -348,56 +436,157 @@ class ImageApprovalGUI:
             self.use_image_btn.config(state=tk.DISABLED)
             return
         
+        # A direct load supersedes any debounced one
+        self.cancel_pending_display()
+        
         # Load current image
         current_image = self.current_images[self.current_image_index]
         image_url = current_image['src']['medium']
         
-        try:
-            # Download and display image
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            
-            # Convert to PIL Image
-            from io import BytesIO
-            img = Image.open(BytesIO(response.content))
-            
-            # Resize to fit display
-            img.thumbnail((400, 300), Image.Resampling.LANCZOS)
-            
-            # Convert to PhotoImage
-            photo = ImageTk.PhotoImage(img)
-            
-            # Update display
-            self.image_label.config(image=photo, text="")
-            self.image_label.image = photo  # Keep reference
-            
-            # Update navigation
-            self.image_counter_label.config(
-                text=f"{self.current_image_index + 1}/{len(self.current_images)}"
-            )
-            
-            self.prev_img_btn.config(state=tk.NORMAL if self.current_image_index > 0 else tk.DISABLED)
-            self.next_img_btn.config(state=tk.NORMAL if self.current_image_index < len(self.current_images) - 1 else tk.DISABLED)
-            self.use_image_btn.config(state=tk.NORMAL)
-            
-            self.status_label.config(text="Ready", foreground="green")
-            
-        except Exception as e:
-            logger.error(f"Error displaying image: {e}")
+        self.display_generation += 1
+        
+        # Revisited images are shown straight from the cache
+        if image_url in self.preview_cache:
+            self.preview_cache.move_to_end(image_url)
+            content, img = self.preview_cache[image_url]
+            self.show_preview_image(image_url, content, img, self.display_generation)
+            return
+        
+        # Don't leave the previous image on screen (and approvable) while this one loads;
+        # show_preview_image re-enables Use once the matching image is displayed
+        self.image_label.config(text="Loading image...", image="")
+        self.use_image_btn.config(state=tk.DISABLED)
+        self.status_label.config(text="Loading image...", foreground="orange")
+        
+        # A prefetch of this image is already in flight; show it when it lands
+        if image_url in self.prefetching:
+            self.prefetching[image_url] = self.display_generation
+            return
+        
+        # Download and decode on a network worker so the UI stays responsive
+        self.network_pool.submit(self.load_preview_image, image_url, self.display_generation)
+        
+    def load_preview_image(self, image_url: str, generation: Optional[int]):
+        """Download and resize a preview image (runs off the UI thread)"""
+        content = self.image_fetcher.fetch_image_bytes(image_url)
+        img = None
+        if content is not None:
+            try:
+                # Convert to PIL Image
+                img = Image.open(io.BytesIO(content))
+                
+                # Resize to fit display
+                img.thumbnail((400, 300), Image.Resampling.LANCZOS)
+                
+            except Exception as e:
+                logger.error(f"Error displaying image: {e}")
+                img = None
+        
+        # Update UI in main thread
+        self.master.after(0, self.show_preview_image, image_url, content, img, generation)
+        
+    def show_preview_image(self, image_url: str, content: Optional[bytes],
+                           img: Optional[Image.Image], generation: Optional[int]):
+        """Show a loaded preview image if it is still the one requested"""
+        waiting_generation = self.prefetching.pop(image_url, None)
+        
+        if img is not None:
+            self.preview_cache[image_url] = (content, img)
+            self.preview_cache.move_to_end(image_url)
+            while len(self.preview_cache) > self.PREVIEW_CACHE_SIZE:
+                self.preview_cache.popitem(last=False)
+        
+        # A finished prefetch is displayed if the user has already navigated to it
+        if generation is None:
+            generation = waiting_generation
+        
+        if generation != self.display_generation:
+            return  # User has navigated away since this load started
+        
+        if img is None:
             self.image_label.config(text="Error loading image", image="")
             self.status_label.config(text="Error loading image", foreground="red")
+            return
+        
+        # Convert to PhotoImage
+        photo = ImageTk.PhotoImage(img)
+        
+        # Update display
+        self.image_label.config(image=photo, text="")
+        self.image_label.image = photo  # Keep reference
+        
+        # Update navigation
+        self.image_counter_label.config(
+            text=f"{self.current_image_index + 1}/{len(self.current_images)}"
+        )
+        
+        self.prev_img_btn.config(state=tk.NORMAL if self.current_image_index > 0 else tk.DISABLED)
+        self.next_img_btn.config(state=tk.NORMAL if self.current_image_index < len(self.current_images) - 1 else tk.DISABLED)
+        self.use_image_btn.config(state=tk.NORMAL)
+        
+        self.status_label.config(text="Ready", foreground="green")
+        
+        self.prefetch_next_image()
+    
+    def prefetch_next_image(self):
+        """Warm the preview cache with the next image so Next doesn't stall"""
+        next_index = self.current_image_index + 1
+        if next_index >= len(self.current_images):
+            return
+        
+        image_url = self.current_images[next_index]['src']['medium']
+        if image_url in self.preview_cache or image_url in self.prefetching:
+            return
+        
+        # A None generation only fills the cache unless update_image_display claims it
+        self.prefetching[image_url] = None
+        self.network_pool.submit(self.load_preview_image, image_url, None)
+    
+    def schedule_image_display(self, delay_ms: int = 150):
+        """Debounce preview loads so rapid Previous/Next clicks trigger a single download"""
+        self.cancel_pending_display()
+        
+        # Cached images cost nothing to show, so don't make the user wait for them
+        image_url = self.current_images[self.current_image_index]['src']['medium']
+        if image_url in self.preview_cache:
+            self.update_image_display()
+            return
+        
+        # A load still running for the previous index must not land under the new counter
+        self.display_generation += 1
+        
+        # The displayed image no longer matches the counter, so it can't be approved
+        self.use_image_btn.config(state=tk.DISABLED)
+        self.status_label.config(text="Loading image...", foreground="orange")
+        
+        # Keep the counter in step with the clicks while the load is pending
+        self.image_counter_label.config(
+            text=f"{self.current_image_index + 1}/{len(self.current_images)}"
+        )
+        self.pending_display_job = self.master.after(delay_ms, self.run_pending_display)
+    
+    def cancel_pending_display(self):
+        """Drop a debounced preview load that hasn't fired yet"""
+        if self.pending_display_job is not None:
+            self.master.after_cancel(self.pending_display_job)
+            self.pending_display_job = None
+    
+    def run_pending_display(self):
+        """Run a debounced preview load"""
+        self.pending_display_job = None
+        self.update_image_display()
     
     def prev_image(self):
         """Show previous image"""
         if self.current_image_index > 0:
             self.current_image_index -= 1
-            self.update_image_display()
+            self.schedule_image_display()
     
     def next_image(self):
         """Show next image"""
         if self.current_image_index < len(self.current_images) - 1:
             self.current_image_index += 1
-            self.update_image_display()
+            self.schedule_image_display()
     
     def use_current_image(self):
         """Use current image for the word"""
@@ -412,9 +601,16 @@ class ImageApprovalGUI:
         filename = f"{word['simplified']}_{self.state_manager.current_index}.jpg"
         filepath = self.media_dir / filename
         
-        self.status_label.config(text="Downloading image...", foreground="orange")
+        if image_url in self.preview_cache:
+            # Reuse the bytes already downloaded for the preview
+            saved = self.save_cached_image(image_url, filepath)
+            failure_text = "Failed to save image"
+        else:
+            self.status_label.config(text="Downloading image...", foreground="orange")
+            saved = self.image_fetcher.download_image(image_url, str(filepath))
+            failure_text = "Failed to download image"
         
-        if self.image_fetcher.download_image(image_url, str(filepath)):
+        if saved:
             # Update state
             self.state_manager.update_current_word(
                 image_path=str(filepath),
@@ -428,9 +624,19 @@ class ImageApprovalGUI:
                 self.load_next_word()
             else:
                 messagebox.showinfo("Complete", "All words have been processed!")
-                self.export_btn.config(state=tk.NORMAL)
+                self.enable_export()
         else:
-            self.status_label.config(text="Failed to download image", foreground="red")
+            self.status_label.config(text=failure_text, foreground="red")
+    
+    def save_cached_image(self, image_url: str, filepath: Path) -> bool:
+        """Write a cached preview's original bytes to filepath"""
+        try:
+            write_file_atomically(filepath, [self.preview_cache[image_url][0]])
+            logger.info(f"Saved cached image: {filepath}")
+            return True
+        except OSError as e:
+            logger.error(f"Error saving cached image to {filepath}: {e}")
+            return False
     
     def skip_word(self):
         """Skip current word without image"""
@@ -440,7 +646,7 @@ class ImageApprovalGUI:
             self.load_next_word()
         else:
             messagebox.showinfo("Complete", "All words have been processed!")
-            self.export_btn.config(state=tk.NORMAL)
+            self.enable_export()
     
     def use_custom_image(self):
         """Allow user to select a custom image file"""
@@ -484,23 +690,15 @@ class ImageApprovalGUI:
                 messagebox.showwarning("Invalid Content", "Clipboard content is not an image.\n\nPlease copy an image first.")
                 return
             
-            # Save clipboard image to temporary file
-            word = self.state_manager.get_current_word()
-            temp_filename = f"clipboard_{word['simplified']}_{self.state_manager.current_index}.png"
-            temp_filepath = self.media_dir / temp_filename
-            
-            # Save with reasonable quality
-            clipboard_image.save(temp_filepath, format='PNG', optimize=True)
-            
-            # Process the pasted image
-            self.process_custom_image(str(temp_filepath), is_clipboard=True)
+            # Process the pasted image directly; no temporary file round trip
+            self.process_custom_image(clipboard_image, is_clipboard=True)
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to paste image from clipboard: {e}")
             logger.error(f"Error pasting image from clipboard: {e}")
     
-    def process_custom_image(self, image_path: str, is_clipboard: bool = False):
-        """Process a custom image (from file or clipboard)"""
+    def process_custom_image(self, image: Union[str, Image.Image], is_clipboard: bool = False):
+        """Process a custom image (a file path, or an already-decoded clipboard image)"""
         try:
             word = self.state_manager.get_current_word()
             
@@ -509,7 +707,7 @@ class ImageApprovalGUI:
             final_filepath = self.media_dir / final_filename
             
             # Load and process image
-            with Image.open(image_path) as img:
+            with (Image.open(image) if isinstance(image, str) else image) as img:
                 # Convert to RGB if necessary
                 if img.mode in ('RGBA', 'LA', 'P'):
                     # Create white background
@@ -528,9 +726,9 @@ class ImageApprovalGUI:
                 
                 # Save processed image
                 img.save(final_filepath, format='JPEG', quality=85, optimize=True)
-            
-            # Update preview
-            self.display_custom_image(final_filepath)
+                
+                # Update preview from the processed pixels instead of re-reading the file
+                self.display_custom_image(img)
             
             # Update state
             self.state_manager.update_current_word(
@@ -542,13 +740,6 @@ class ImageApprovalGUI:
             source_text = "clipboard" if is_clipboard else "file"
             self.status_label.config(text=f"Custom image from {source_text} saved", foreground="green")
             
-            # Clean up temporary clipboard file
-            if is_clipboard and image_path != str(final_filepath):
-                try:
-                    os.remove(image_path)
-                except:
-                    pass
-            
             logger.info(f"Custom image processed: {final_filepath}")
             
             # Ask if user wants to continue or approve this image
@@ -565,20 +756,24 @@ class ImageApprovalGUI:
                     self.load_next_word()
                 else:
                     messagebox.showinfo("Complete", "All words have been processed!")
-                    self.export_btn.config(state=tk.NORMAL)
+                    self.enable_export()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to process custom image: {e}")
             logger.error(f"Error processing custom image: {e}")
     
-    def display_custom_image(self, image_path: str):
+    def display_custom_image(self, img: Image.Image):
         """Display the custom image in the preview"""
+        # Supersede any stock preview that is still loading or waiting to load
+        self.cancel_pending_display()
+        self.display_generation += 1
+        
         try:
-            # Load and display image
-            img = Image.open(image_path)
-            img.thumbnail((400, 300), Image.Resampling.LANCZOS)
+            # Resize a copy for display
+            preview = img.copy()
+            preview.thumbnail((400, 300), Image.Resampling.LANCZOS)
             
-            photo = ImageTk.PhotoImage(img)
+            photo = ImageTk.PhotoImage(preview)
             self.image_label.config(image=photo, text="")
             self.image_label.image = photo  # Keep reference
             
@@ -591,14 +786,54 @@ class ImageApprovalGUI:
         except Exception as e:
             logger.error(f"Error displaying custom image: {e}")
     
+    def on_close(self):
+        """Stop background network work and release connections before closing"""
+        self.cancel_pending_display()
+        self.network_pool.shutdown(wait=False, cancel_futures=True)
+        self.image_fetcher.close()
+        self.master.destroy()
+    
+    def enable_export(self):
+        """Re-enable the Export button unless an export is already running"""
+        if not self.exporting:
+            self.export_btn.config(state=tk.NORMAL)
+    
     def export_deck(self):
         """Export approved words to Anki deck"""
+        if self.exporting:
+            return
+        
+        self.exporting = True
+        self.export_btn.config(state=tk.DISABLED)
+        self.status_label.config(text="Exporting deck...", foreground="orange")
+        
+        # Package media in separate thread; export from a snapshot so later edits can't race it
+        threading.Thread(
+            target=self.run_export,
+            args=(self.state_manager.df.copy(),),
+            daemon=True
+        ).start()
+    
+    def run_export(self, df: pd.DataFrame):
+        """Build and write the deck (runs off the UI thread)"""
         try:
-            exporter = AnkiDeckExporter(self.state_manager.df)
-            filename = exporter.export_deck()
-            messagebox.showinfo("Success", f"Anki deck exported as: {filename}")
+            filename = AnkiDeckExporter(df).export_deck()
+            self.master.after(0, self.finish_export, filename, None)
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to export deck: {e}")
+            logger.error(f"Error exporting deck: {e}")
+            self.master.after(0, self.finish_export, None, e)
+    
+    def finish_export(self, filename: Optional[str], error: Optional[Exception]):
+        """Report export result in the main thread"""
+        self.exporting = False
+        self.enable_export()
+        
+        if error is not None:
+            self.status_label.config(text="Export failed", foreground="red")
+            messagebox.showerror("Error", f"Failed to export deck: {error}")
+        else:
+            self.status_label.config(text="Deck exported", foreground="green")
+            messagebox.showinfo("Success", f"Anki deck exported as: {filename}")
 
 class AnkiDeckExporter:
     """Module for exporting Anki decks"""
@@ -677,20 +912,25 @@ class AnkiDeckExporter:
         
         # Add notes
         media_files = []
-        for _, word in approved_words.iterrows():
+        # Iterate the needed columns directly; iterrows() would box every row into a Series
+        for simplified, pinyin, image_path in zip(
+            approved_words['simplified'],
+            approved_words['pinyin'],
+            approved_words['image_path']
+        ):
             # Prepare image
             image_html = ""
-            if word['image_path'] and os.path.exists(word['image_path']):
-                image_filename = os.path.basename(word['image_path'])
-                media_files.append(word['image_path'])
-                image_html = f'<img src="{image_filename}" alt="Image for {word["simplified"]}">'
+            if image_path and os.path.exists(image_path):
+                image_filename = os.path.basename(image_path)
+                media_files.append(image_path)
+                image_html = f'<img src="{image_filename}" alt="Image for {simplified}">'
             
             # Create note
             note = genanki.Note(
                 model=model,
                 fields=[
-                    word['simplified'],
-                    word['pinyin'],
+                    simplified,
+                    pinyin,
                     image_html
                 ]
             )
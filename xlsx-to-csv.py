@@ -9,8 +9,18 @@ import re
 import sys
 import os
 from pathlib import Path
-from tkinter import filedialog, messagebox
-import tkinter as tk
+
+# Column-name fragments used to detect each field, in priority order
+SIMPLIFIED_CANDIDATES = ('simplified', 'simple', 'simp', 'character', 'char')
+TRADITIONAL_CANDIDATES = ('traditional', 'trad', 'char')
+PINYIN_CANDIDATES = ('pinyin', 'pin', 'pronunciation', 'roman')
+MEANING_CANDIDATES = ('meaning', 'english', 'definition', 'translation', 'def')
+REQUIRED_KEYS = ('simplified', 'pinyin', 'meaning')
+
+# Patterns used by clean_meaning_text, compiled once
+WHITESPACE_RE = re.compile(r'\s+')
+POS_PREFIX_RE = re.compile(r'^(det\.|Audio|adj\.|adv\.|n\.|v\.|prep\.):\s*', re.IGNORECASE)
+ASTERISKS_RE = re.compile(r'\*+')
 
 class ExcelToCsvConverter:
     """Converts Excel vocabulary files to CSV format for Anki pipeline"""
@@ -47,19 +57,20 @@ class ExcelToCsvConverter:
         text = str(text)
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = WHITESPACE_RE.sub(' ', text).strip()
         
         # Remove "det.:", "Audio:", and similar prefixes
-        text = re.sub(r'^(det\.|Audio|adj\.|adv\.|n\.|v\.|prep\.):\s*', '', text, flags=re.IGNORECASE)
+        text = POS_PREFIX_RE.sub('', text)
         
-        # Remove asterisks and other markdown
-        text = re.sub(r'\*+', '', text)
+        # Remove asterisks and other markdown (most meanings have none)
+        if '*' in text:
+            text = ASTERISKS_RE.sub('', text)
         
         # Clean up multiple definitions - take the first main definition
-        if ',' in text:
-            # Split by comma and take the first substantial definition
-            parts = text.split(',')
-            main_def = parts[0].strip()
+        main_def, comma, _ = text.partition(',')
+        if comma:
+            # Take the first substantial definition (only the first comma matters)
+            main_def = main_def.strip()
             if len(main_def) > 2:  # Ensure it's not just "I" or "me"
                 text = main_def
         
@@ -85,7 +96,7 @@ class ExcelToCsvConverter:
             # Extract data using detected mapping
             output_df['simplified'] = self.df[column_mapping['simplified']]
             output_df['pinyin'] = self.df[column_mapping['pinyin']]
-            output_df['english_meaning'] = self.df[column_mapping['meaning']].apply(self.clean_meaning_text)
+            output_df['english_meaning'] = self.df[column_mapping['meaning']]
             
             # Add required columns for pipeline
             output_df['image_path'] = ''
@@ -98,6 +109,11 @@ class ExcelToCsvConverter:
             # Remove duplicates based on simplified character
             output_df = output_df.drop_duplicates(subset=['simplified'], keep='first')
             
+            # Clean meanings only for the rows that survived filtering
+            output_df = output_df.assign(
+                english_meaning=output_df['english_meaning'].apply(self.clean_meaning_text)
+            )
+            
             self.df = output_df
             
             print(f"\nConverted to pipeline format:")
@@ -117,8 +133,7 @@ class ExcelToCsvConverter:
         mapping = {}
         
         # Detect simplified column
-        simplified_candidates = ['simplified', 'simple', 'simp', 'character', 'char']
-        for candidate in simplified_candidates:
+        for candidate in SIMPLIFIED_CANDIDATES:
             for i, col in enumerate(columns):
                 if candidate in col:
                     mapping['simplified'] = self.df.columns[i]
@@ -128,8 +143,7 @@ class ExcelToCsvConverter:
         
         # If no simplified column found, try to use traditional or first column
         if 'simplified' not in mapping:
-            traditional_candidates = ['traditional', 'trad', 'char']
-            for candidate in traditional_candidates:
+            for candidate in TRADITIONAL_CANDIDATES:
                 for i, col in enumerate(columns):
                     if candidate in col:
                         mapping['simplified'] = self.df.columns[i]
@@ -142,8 +156,7 @@ class ExcelToCsvConverter:
             mapping['simplified'] = self.df.columns[0]
         
         # Detect pinyin column
-        pinyin_candidates = ['pinyin', 'pin', 'pronunciation', 'roman']
-        for candidate in pinyin_candidates:
+        for candidate in PINYIN_CANDIDATES:
             for i, col in enumerate(columns):
                 if candidate in col:
                     mapping['pinyin'] = self.df.columns[i]
@@ -152,8 +165,7 @@ class ExcelToCsvConverter:
                 break
         
         # Detect meaning column
-        meaning_candidates = ['meaning', 'english', 'definition', 'translation', 'def']
-        for candidate in meaning_candidates:
+        for candidate in MEANING_CANDIDATES:
             for i, col in enumerate(columns):
                 if candidate in col:
                     mapping['meaning'] = self.df.columns[i]
@@ -167,10 +179,9 @@ class ExcelToCsvConverter:
             print(f"  {key}: {value}")
         
         # Validate mapping
-        required_keys = ['simplified', 'pinyin', 'meaning']
-        if not all(key in mapping for key in required_keys):
+        if not all(key in mapping for key in REQUIRED_KEYS):
             print(f"\nError: Could not detect all required columns.")
-            print(f"Required: {required_keys}")
+            print(f"Required: {list(REQUIRED_KEYS)}")
             print(f"Found: {list(mapping.keys())}")
             return None
         
@@ -188,6 +199,10 @@ class ExcelToCsvConverter:
     
     def interactive_convert(self):
         """Interactive conversion with file dialogs"""
+        # Imported here so command-line conversion works without Tk
+        import tkinter as tk
+        from tkinter import filedialog, messagebox
+        
         # Hide the root window
         root = tk.Tk()
         root.withdraw()